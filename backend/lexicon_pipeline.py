@@ -16,6 +16,8 @@ from google import generativeai as genai
 import chromadb
 from pathlib import Path
 import requests  # For Firecrawl API
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
 # Import our document processor
@@ -56,6 +58,21 @@ class LEXICONPipeline:
             "arxiv": "https://arxiv.org/search/?query=",
             "firecrawl_api_key": os.getenv("FIRECRAWL_API_KEY")
         }
+        
+        # Pooled HTTP session so repeated Firecrawl scrapes reuse keep-alive connections
+        self.http_session = requests.Session()
+        # Retry connection failures and gateway errors, but not read timeouts:
+        # a slow scrape already used its full read window
+        retries = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["POST"]
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retries)
+        self.http_session.mount("https://", adapter)
+        self.http_session.mount("http://", adapter)
     
     async def search_external_database(self, url: str, source: str) -> Optional[str]:
         """
@@ -87,7 +104,14 @@ class LEXICONPipeline:
                 }
             }
             
-            response = requests.post(firecrawl_url, headers=headers, json=payload, timeout=30)
+            # Run the blocking request (and its retries) off the event loop
+            response = await asyncio.to_thread(
+                self.http_session.post,
+                firecrawl_url,
+                headers=headers,
+                json=payload,
+                timeout=(3.05, 30)
+            )
             
             if response.status_code == 200:
                 data = response.json()
@@ -417,11 +441,14 @@ class LEXICONPipeline:
                 )
                 
                 # Process results through AI agents for analysis
-                legal_analysis = await self._analyze_legal_research(
-                    legal_results, case_analysis, case_strategy
-                )
-                scientific_analysis = await self._analyze_scientific_research(
-                    scientific_results, case_analysis, case_strategy
+                # (the two analyses are independent, so run them concurrently)
+                legal_analysis, scientific_analysis = await asyncio.gather(
+                    self._analyze_legal_research(
+                        legal_results, case_analysis, case_strategy
+                    ),
+                    self._analyze_scientific_research(
+                        scientific_results, case_analysis, case_strategy
+                    )
                 )
                 
                 return {
@@ -712,7 +739,9 @@ class LEXICONPipeline:
         """
         
         # Agent 2: o3-pro-deep-research with high reasoning effort
-        response = self.openai_client.chat.completions.create(
+        # Run the blocking client call in a worker thread so it can overlap with Agent 3
+        response = await asyncio.to_thread(
+            self.openai_client.chat.completions.create,
             model="o3-pro-deep-research",  # o3-pro-deep-research model
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
@@ -747,7 +776,8 @@ class LEXICONPipeline:
         Cite specific studies and findings.
         """
         
-        response = self.openai_client.chat.completions.create(
+        response = await asyncio.to_thread(
+            self.openai_client.chat.completions.create,
             model="o4-mini-deep-research",  # o4-mini-deep-research model
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3
@@ -4,6 +4,8 @@ Requires API key from https://serpapi.com/manage-api-key
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from typing import Dict, List
 
@@ -11,6 +13,16 @@ class GoogleScholarSearch:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://serpapi.com/search.json"
+        
+        # Keep-alive session so consecutive searches skip the TLS handshake
+        self.session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False  # Let the status check below report the final failure
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retries))
     
     def search_daubert_cases(self, query: str = "daubert standard expert witness", num_results: int = 10) -> List[Dict]:
         """Search Google Scholar for Daubert-related cases and articles"""
@@ -23,7 +35,7 @@ class GoogleScholarSearch:
             'as_ylo': 2020  # Results from 2020 onwards
         }
         
-        response = requests.get(self.base_url, params=params)
+        response = self.session.get(self.base_url, params=params)
         
         if response.status_code == 200:
             data = response.json()
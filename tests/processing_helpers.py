@@ -0,0 +1,101 @@
+"""
+Shared helpers for the document processing test scripts
+- Cached DocumentProcessor construction
+- Manifest of already-embedded documents, so repeated runs skip unchanged files
+"""
+import os
+import json
+import hashlib
+import functools
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+MANIFEST_PATH = Path("./lexicon-output/.cache/processed_manifest.json")
+
+@functools.lru_cache(maxsize=4)
+def get_processor(collection_name: str):
+    """Build a DocumentProcessor once per collection and reuse it across calls"""
+    # Imported here so loading the test scripts doesn't pull in ChromaDB and the AI SDKs
+    from document_processor import DocumentProcessor
+    return DocumentProcessor(collection_name=collection_name)
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Dict]:
+    """Load the manifest, or an empty one if it doesn't exist yet"""
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_manifest(manifest: Dict[str, Dict], path: Path = MANIFEST_PATH):
+    """Write the manifest atomically so an interrupted run can't corrupt it"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    os.replace(tmp_path, path)
+
+def _content_hash(file_path: str) -> str:
+    return hashlib.blake2b(Path(file_path).read_bytes(), digest_size=16).hexdigest()
+
+def _is_unchanged(file_path: str, entry: Dict) -> bool:
+    """Cheap mtime+size check first, content hash only when mtime moved"""
+    stat = os.stat(file_path)
+    if stat.st_size != entry.get('size'):
+        return False
+    if stat.st_mtime == entry.get('mtime'):
+        return True
+    if _content_hash(file_path) != entry.get('key'):
+        return False
+    # Touched but identical: store the new mtime so later runs skip the hash
+    entry['mtime'] = stat.st_mtime
+    return True
+
+def _vectors_resolve(processor, vector_ids: List[str]) -> bool:
+    """Make sure the recorded chunks are still in the collection"""
+    if not vector_ids:
+        return True
+    try:
+        found = processor.collection.get(ids=vector_ids)
+    except Exception:
+        return False
+    return len(found.get('ids', [])) == len(vector_ids)
+
+def split_unchanged(processor, file_paths: List[str], manifest: Dict[str, Dict]) -> Tuple[List[str], List[str]]:
+    """
+    Split file_paths into (to_process, skipped)
+    A file is skipped when its manifest entry matches and its vectors still exist;
+    entries may get a refreshed mtime, so save the manifest afterwards
+    """
+    to_process, skipped = [], []
+    for file_path in file_paths:
+        entry = manifest.get(file_path)
+        if entry and _is_unchanged(file_path, entry) and _vectors_resolve(processor, entry.get('vector_ids', [])):
+            skipped.append(file_path)
+        else:
+            to_process.append(file_path)
+    return to_process, skipped
+
+def record_processed(manifest: Dict[str, Dict], results: Dict):
+    """
+    Add every successfully processed file from a process_documents result
+    
+    process_documents appends each file's chunk IDs to the pooled vector_ids
+    in processed_files order, as the run {base_id}_chunk_0, _1, ... (see
+    DocumentProcessor._create_embeddings), so each file takes its own run in
+    order. Files sharing a stem (report.pdf, report.docx) still get separate
+    entries here, though they share chunk IDs in ChromaDB itself.
+    """
+    vector_ids = results.get('vector_ids', [])
+    pos = 0
+    for file_path in results.get('processed_files', []):
+        base_id = Path(file_path).stem.replace(" ", "_").replace(".", "_")
+        file_ids = []
+        while pos < len(vector_ids) and vector_ids[pos] == f"{base_id}_chunk_{len(file_ids)}":
+            file_ids.append(vector_ids[pos])
+            pos += 1
+        stat = os.stat(file_path)
+        manifest[file_path] = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'key': _content_hash(file_path),
+            'vector_ids': file_ids
+        }
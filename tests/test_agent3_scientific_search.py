@@ -4,12 +4,18 @@ Enhanced Google Scholar capabilities for academic/scientific papers
 """
 
 import asyncio
-from lexicon_external_research import ExternalResearchModule
 import json
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 async def test_scientific_search():
     """Test Agent 3's scientific research capabilities"""
+    from lexicon_external_research import ExternalResearchModule
     
     print("=" * 80)
     print("AGENT 3 (GPT-4.1) - SCIENTIFIC DOMAIN RESEARCH TEST")
@@ -36,20 +42,24 @@ async def test_scientific_search():
     ]
     
     async with ExternalResearchModule() as research:
-        for test in test_cases:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test['name']}")
-            print(f"Strategy: {test['strategy'].upper()}")
-            print(f"Methodologies: {', '.join(test['methodologies'])}")
-            print("="*60)
-            
-            # Run scientific research
-            results = await research.scientific_domain_research(
+        # Run scientific research for all test cases concurrently
+        all_results = await asyncio.gather(*[
+            research.scientific_domain_research(
                 expert_name=test['expert'],
                 methodologies=test['methodologies'],
                 findings=test['findings'],
                 case_strategy=test['strategy']
             )
+            for test in test_cases
+        ])
+        
+        # Print serially so output from different cases doesn't interleave
+        for test, results in zip(test_cases, all_results):
+            print(f"\n{'='*60}")
+            print(f"TEST: {test['name']}")
+            print(f"Strategy: {test['strategy'].upper()}")
+            print(f"Methodologies: {', '.join(test['methodologies'])}")
+            print("="*60)
             
             # Display Google Scholar results
             print(f"\nGOOGLE SCHOLAR SCIENTIFIC RESULTS:")
@@ -58,9 +68,14 @@ async def test_scientific_search():
             scholar_results = results.get('google_scholar_scientific', [])
             
             if scholar_results:
-                # Group by quality score
-                high_quality = [r for r in scholar_results if r.get('quality_score', 0) >= 0.7]
-                medium_quality = [r for r in scholar_results if 0.3 <= r.get('quality_score', 0) < 0.7]
+                # Group by quality score in a single pass
+                high_quality, medium_quality = [], []
+                for r in scholar_results:
+                    quality = r.get('quality_score', 0)
+                    if quality >= 0.7:
+                        high_quality.append(r)
+                    elif quality >= 0.3:
+                        medium_quality.append(r)
                 
                 if high_quality:
                     print(f"\nHIGH QUALITY PAPERS ({len(high_quality)}):")
@@ -150,12 +165,19 @@ async def demonstrate_query_building():
 
 def save_results(results, filename):
     """Save results to JSON for analysis"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'agent': 'Agent 3 (GPT-4.1) Scientific Domain',
-            'results': results
-        }, f, indent=2, ensure_ascii=False)
+    payload = {
+        'timestamp': datetime.now().isoformat(),
+        'agent': 'Agent 3 (GPT-4.1) Scientific Domain',
+        'results': results
+    }
+    if orjson is not None:
+        # orjson writes UTF-8 directly, matching ensure_ascii=False
+        Path(filename).write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
     print(f"\nResults saved to: {filename}")
 
 if __name__ == "__main__":
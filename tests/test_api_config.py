@@ -5,20 +5,27 @@ Verifies all API keys are properly configured
 
 import os
 from dotenv import load_dotenv
-import google.generativeai as genai
 
 # Load environment variables
 load_dotenv()
 
+# Snapshot the keys once so every check below reads the same values
+ENV = {k: os.environ.get(k) for k in (
+    'ANTHROPIC_API_KEY',
+    'OPENAI_API_KEY',
+    'GOOGLEAI_STUDIO_API_KEY',
+    'SERP_API_KEY'
+)}
+
 print("LEXICON API Configuration Test")
 print("=" * 60)
 
 # Test API key presence
 apis = {
-    'Anthropic (Claude)': os.getenv('ANTHROPIC_API_KEY'),
-    'OpenAI (GPT)': os.getenv('OPENAI_API_KEY'),
-    'Google AI (Gemini)': os.getenv('GOOGLEAI_STUDIO_API_KEY'),
-    'SerpAPI (Scholar)': os.getenv('SERP_API_KEY')
+    'Anthropic (Claude)': ENV['ANTHROPIC_API_KEY'],
+    'OpenAI (GPT)': ENV['OPENAI_API_KEY'],
+    'Google AI (Gemini)': ENV['GOOGLEAI_STUDIO_API_KEY'],
+    'SerpAPI (Scholar)': ENV['SERP_API_KEY']
 }
 
 print("\nAPI Key Status:")
@@ -35,32 +42,27 @@ for name, key in apis.items():
 print("\n\nTesting Gemini 2.5 Pro Configuration:")
 print("-" * 40)
 try:
-    genai.configure(api_key=os.getenv('GOOGLEAI_STUDIO_API_KEY'))
+    # Imported here so the key-presence check above doesn't pay for the SDK import
+    import google.generativeai as genai
+    genai.configure(api_key=ENV['GOOGLEAI_STUDIO_API_KEY'])
     
-    # List available models
+    # List available models (fetched once and reused for model selection)
     print("Available Gemini models:")
+    available = set()
     for model in genai.list_models():
         if 'generateContent' in model.supported_generation_methods:
             print(f"  - {model.name}")
+            available.add(model.name.split('/')[-1])
     
-    # Try to initialize Gemini 2.5 Pro
+    # Pick the first candidate the API actually offers instead of probing each one
     print("\nAttempting to initialize Gemini 2.5 Pro...")
-    try:
-        model = genai.GenerativeModel('gemini-2.0-pro-exp')
-        print("[OK] Gemini 2.5 Pro (experimental) initialized successfully!")
-    except Exception as e:
-        print(f"[FAILED] Failed to initialize gemini-2.0-pro-exp: {e}")
-        print("\nTrying alternative model names...")
-        
-        # Try other possible model names
-        alternatives = ['gemini-pro', 'gemini-1.5-pro', 'gemini-pro-latest']
-        for alt in alternatives:
-            try:
-                model = genai.GenerativeModel(alt)
-                print(f"[OK] {alt} initialized successfully!")
-                break
-            except:
-                print(f"[FAILED] {alt} not available")
+    candidates = ('gemini-2.0-pro-exp', 'gemini-pro', 'gemini-1.5-pro', 'gemini-pro-latest')
+    chosen = next((c for c in candidates if c in available), None)
+    if chosen:
+        model = genai.GenerativeModel(chosen)
+        print(f"[OK] {chosen} initialized successfully!")
+    else:
+        print(f"[FAILED] None of {', '.join(candidates)} are available")
                 
 except Exception as e:
     print(f"[ERROR] Gemini configuration failed: {e}")
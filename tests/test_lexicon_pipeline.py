@@ -1,21 +1,77 @@
 """
 Test LEXICON Pipeline with both challenge and support strategies
 """
+import os
+import re
 import asyncio
-from lexicon_pipeline import LEXICONPipeline
+import itertools
 from pathlib import Path
 import json
+import pytest
+
+# Common experts from the corpus
+EXPERTS = [
+    "Kenneth J.D. Allen",
+    "Dr. Steven Rothke",
+    "Guy William Fried",
+    "Lauren A. Richerson"
+]
+
+# Motion types available for each strategy; the first entry is the default
+MOTION_TYPES = {
+    "support": [
+        "Response to Defendant's Daubert Motion",
+        "Response to Motion in Limine",
+        "Motion to Qualify Expert Witness"
+    ],
+    "challenge": [
+        "Daubert Motion to Exclude Expert Testimony",
+        "Motion in Limine to Exclude Expert",
+        "Motion to Strike Expert Testimony"
+    ]
+}
+
+# Every (expert, strategy, motion) combination for the parametrized pipeline test
+CASE_MATRIX = [
+    (expert, strategy, motion)
+    for expert, (strategy, motions) in itertools.product(EXPERTS, MOTION_TYPES.items())
+    for motion in motions
+]
+
+_SLUG_RE = re.compile(r'[^A-Za-z0-9]+')
+
+def _slug(name: str) -> str:
+    """Filename-safe form of an expert name, e.g. Dr. Steven Rothke -> Dr_Steven_Rothke"""
+    return _SLUG_RE.sub('_', name).strip('_')
+
+def _write_brief(path: Path, text: str):
+    """Write a generated brief to disk"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+async def _generate_and_save(pipeline, path: Path, **case_kwargs) -> Path:
+    """Run the pipeline for one case and save its brief off the event loop"""
+    result = await pipeline.process_case(**case_kwargs)
+    # Write in a worker thread so the other pipeline keeps running meanwhile
+    await asyncio.to_thread(_write_brief, path, result['final_brief'])
+    return path
 
 async def test_both_strategies():
     """
     Test the pipeline with both challenge AND support strategies
     Shows LEXICON's versatility in legal strategy
     """
+    # Imported here so loading this module stays cheap (pulls in ChromaDB and all AI SDKs)
+    from lexicon_pipeline import LEXICONPipeline
+    
     pipeline = LEXICONPipeline()
     
     # Let's test with YOUR expert profile, Dr. Allen
     test_expert = "Kenneth J.D. Allen"
     
+    # For demo, we'll use a hypothetical opposing expert
+    opposing_expert = "Dr. Steven Rothke"  # From your corpus
+    
     print("\n" + "="*80)
     print("🧪 LEXICON PIPELINE TEST - DUAL STRATEGY DEMONSTRATION")
     print("="*80)
@@ -24,51 +80,43 @@ async def test_both_strategies():
     print("="*80 + "\n")
     
     # Test 1: SUPPORT our expert (plaintiff's expert)
+    # Test 2: CHALLENGE opposing expert (defense's expert)
+    # Both pipelines are independent, so generate the briefs concurrently
     print("\n📋 TEST 1: SUPPORTING OUR EXPERT (Plaintiff's Expert)")
+    print("📋 TEST 2: CHALLENGING OPPOSING EXPERT (Defense's Expert)")
     print("-" * 60)
     
-    try:
-        support_result = await pipeline.process_case(
-            target_expert=test_expert,
-            case_strategy="support",
-            motion_type="Response to Defendant's Daubert Motion"
-        )
-        
-        # Save support brief
-        output_dir = Path("./lexicon-output/test-briefs")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        support_path = output_dir / f"SUPPORT_{test_expert.replace(' ', '_')}_response.txt"
-        with open(support_path, 'w', encoding='utf-8') as f:
-            f.write(support_result['final_brief'])
-        
-        print(f"✅ Support brief saved to: {support_path}")
-        
-    except Exception as e:
-        print(f"❌ Error in support test: {e}")
+    output_dir = Path("./lexicon-output/test-briefs")
+    support_path = output_dir / f"SUPPORT_{_slug(test_expert)}_response.txt"
+    challenge_path = output_dir / f"CHALLENGE_{_slug(opposing_expert)}_motion.txt"
     
-    # Test 2: CHALLENGE opposing expert (defense's expert)
-    print("\n\n📋 TEST 2: CHALLENGING OPPOSING EXPERT (Defense's Expert)")
-    print("-" * 60)
+    support_task = asyncio.create_task(_generate_and_save(
+        pipeline, support_path,
+        target_expert=test_expert,
+        case_strategy="support",
+        motion_type="Response to Defendant's Daubert Motion"
+    ))
+    challenge_task = asyncio.create_task(_generate_and_save(
+        pipeline, challenge_path,
+        target_expert=opposing_expert,
+        case_strategy="challenge",
+        motion_type="Motion in Limine to Exclude Defense Expert"
+    ))
     
-    # For demo, we'll use a hypothetical opposing expert
-    opposing_expert = "Dr. Steven Rothke"  # From your corpus
+    # return_exceptions keeps one failure from cancelling the other test
+    support_result, challenge_result = await asyncio.gather(
+        support_task, challenge_task, return_exceptions=True
+    )
     
-    try:
-        challenge_result = await pipeline.process_case(
-            target_expert=opposing_expert,
-            case_strategy="challenge",
-            motion_type="Motion in Limine to Exclude Defense Expert"
-        )
-        
-        challenge_path = output_dir / f"CHALLENGE_{opposing_expert.replace(' ', '_').replace('.', '')}_motion.txt"
-        with open(challenge_path, 'w', encoding='utf-8') as f:
-            f.write(challenge_result['final_brief'])
-        
-        print(f"✅ Challenge brief saved to: {challenge_path}")
-        
-    except Exception as e:
-        print(f"❌ Error in challenge test: {e}")
+    if isinstance(support_result, Exception):
+        print(f"❌ Error in support test: {support_result}")
+    else:
+        print(f"✅ Support brief saved to: {support_result}")
+    
+    if isinstance(challenge_result, Exception):
+        print(f"❌ Error in challenge test: {challenge_result}")
+    else:
+        print(f"✅ Challenge brief saved to: {challenge_result}")
     
     # Summary
     print("\n" + "="*80)
@@ -83,29 +131,24 @@ async def interactive_test():
     """
     Interactive test allowing user to choose expert and strategy
     """
+    # Deferred import, as in test_both_strategies
+    from lexicon_pipeline import LEXICONPipeline
+    
     pipeline = LEXICONPipeline()
     
     print("\n" + "="*80)
     print("🎯 LEXICON PIPELINE - INTERACTIVE TEST")
     print("="*80)
     
-    # Common experts from the corpus
-    experts = [
-        "Kenneth J.D. Allen",
-        "Dr. Steven Rothke",
-        "Guy William Fried",
-        "Lauren A. Richerson"
-    ]
-    
     print("\nAvailable experts from corpus:")
-    for i, expert in enumerate(experts, 1):
+    for i, expert in enumerate(EXPERTS, 1):
         print(f"  {i}. {expert}")
-    print(f"  {len(experts) + 1}. Enter custom expert name")
+    print(f"  {len(EXPERTS) + 1}. Enter custom expert name")
     
     choice = input("\nSelect expert (1-5): ")
     
-    if choice.isdigit() and 1 <= int(choice) <= len(experts):
-        target_expert = experts[int(choice) - 1]
+    if choice.isdigit() and 1 <= int(choice) <= len(EXPERTS):
+        target_expert = EXPERTS[int(choice) - 1]
     else:
         target_expert = input("Enter expert name: ")
     
@@ -128,19 +171,7 @@ async def interactive_test():
     
     motion_choice = input("\nSelect motion type (1-3): ")
     
-    if case_strategy == "support":
-        motion_types = [
-            "Response to Defendant's Daubert Motion",
-            "Response to Motion in Limine",
-            "Motion to Qualify Expert Witness"
-        ]
-    else:
-        motion_types = [
-            "Daubert Motion to Exclude Expert Testimony",
-            "Motion in Limine to Exclude Expert",
-            "Motion to Strike Expert Testimony"
-        ]
-    
+    motion_types = MOTION_TYPES[case_strategy]
     motion_type = motion_types[int(motion_choice) - 1] if motion_choice.isdigit() and 1 <= int(motion_choice) <= 3 else motion_types[0]
     
     print(f"\n🚀 Generating {case_strategy.upper()} brief for {target_expert}...")
@@ -155,15 +186,13 @@ async def interactive_test():
         
         # Save the brief
         output_dir = Path("./lexicon-output/interactive-briefs")
-        output_dir.mkdir(parents=True, exist_ok=True)
         
         from datetime import datetime
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{case_strategy.upper()}_{target_expert.replace(' ', '_').replace('.', '')}_{timestamp}.txt"
+        filename = f"{case_strategy.upper()}_{_slug(target_expert)}_{timestamp}.txt"
         brief_path = output_dir / filename
         
-        with open(brief_path, 'w', encoding='utf-8') as f:
-            f.write(result['final_brief'])
+        await asyncio.to_thread(_write_brief, brief_path, result['final_brief'])
         
         print(f"\n✅ Brief saved to: {brief_path}")
         print(f"📄 Length: {len(result['final_brief'])} characters")
@@ -179,6 +208,27 @@ async def interactive_test():
         import traceback
         traceback.print_exc()
 
+@pytest.fixture(scope="session")
+def pipeline():
+    """One LEXICONPipeline shared by every parametrized case in the session"""
+    from lexicon_pipeline import LEXICONPipeline
+    return LEXICONPipeline()
+
+@pytest.mark.skipif(
+    not os.getenv("LEXICON_RUN_PIPELINE_MATRIX"),
+    reason="Runs the full pipeline against live APIs; set LEXICON_RUN_PIPELINE_MATRIX=1 to enable"
+)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("expert,strategy,motion", CASE_MATRIX)
+async def test_case(pipeline, expert, strategy, motion):
+    """Generate a brief for one expert/strategy/motion combination"""
+    result = await pipeline.process_case(
+        target_expert=expert,
+        case_strategy=strategy,
+        motion_type=motion
+    )
+    assert result['final_brief']
+
 def main():
     """
     Main menu for testing
@@ -4,7 +4,7 @@ Test processing with a small sample of documents
 import os
 import json
 from pathlib import Path
-from document_processor import DocumentProcessor
+from processing_helpers import get_processor, load_manifest, save_manifest, split_unchanged, record_processed
 from dotenv import load_dotenv
 import logging
 
@@ -17,7 +17,7 @@ def test_sample_processing():
     load_dotenv()
     
     # Initialize processor
-    processor = DocumentProcessor(collection_name="lexicon_tbi_test")
+    processor = get_processor("lexicon_tbi_test")
     
     # Get a few test files of different types
     test_files = [
@@ -31,30 +31,47 @@ def test_sample_processing():
     
     logger.info(f"Testing with {len(existing_files)} files")
     
-    # Process each file individually to better catch errors
+    if not existing_files:
+        return
+    
+    # Skip files that are unchanged since their last successful embedding
+    manifest = load_manifest()
+    to_process, skipped = split_unchanged(processor, existing_files, manifest)
+    
+    # Process all files in one call so extraction and embedding can be batched;
+    # process_documents records failures per file, so diagnostics stay granular
+    results = {"processed_files": [], "extracted_variables": {}, "vector_ids": [], "errors": []}
+    if to_process:
+        try:
+            results = processor.process_documents(to_process)
+        except Exception as e:
+            logger.error(f"✗ Exception: {e}")
+            return
+        record_processed(manifest, results)
+    save_manifest(manifest)
+    
+    errors_by_file = {err["file"]: err["error"] for err in results["errors"]}
+    
     for file_path in existing_files:
         logger.info(f"\n{'='*60}")
         logger.info(f"Processing: {Path(file_path).name}")
         logger.info(f"{'='*60}")
         
-        try:
-            results = processor.process_documents([file_path])
-            
-            # Show results
-            if results["processed_files"]:
-                logger.info("✓ SUCCESS")
-                vars = results["extracted_variables"].get(Path(file_path).name, {})
-                logger.info(f"Expert: {vars.get('expert_name', 'N/A')}")
-                logger.info(f"Type: {vars.get('document_type', 'N/A')}")
-                logger.info(f"Date: {vars.get('document_date', 'N/A')}")
-                logger.info(f"Vectors created: {len([v for v in results['vector_ids'] if v])}")
-            else:
-                logger.error("✗ FAILED")
-                if results["errors"]:
-                    logger.error(f"Error: {results['errors'][0]['error']}")
-                    
-        except Exception as e:
-            logger.error(f"✗ Exception: {e}")
+        # Show results
+        if file_path in skipped:
+            logger.info("↷ SKIPPED (unchanged and already embedded)")
+        elif file_path in results["processed_files"]:
+            logger.info("✓ SUCCESS")
+            vars = results["extracted_variables"].get(Path(file_path).name, {})
+            logger.info(f"Expert: {vars.get('expert_name', 'N/A')}")
+            logger.info(f"Type: {vars.get('document_type', 'N/A')}")
+            logger.info(f"Date: {vars.get('document_date', 'N/A')}")
+        else:
+            logger.error("✗ FAILED")
+            if file_path in errors_by_file:
+                logger.error(f"Error: {errors_by_file[file_path]}")
+    
+    logger.info(f"\nVectors created: {len([v for v in results['vector_ids'] if v])}")
 
 if __name__ == "__main__":
     test_sample_processing()
\ No newline at end of file
@@ -2,13 +2,78 @@
 Test TBI Daubert searches using SerpAPI
 """
 
-import requests
+import os
+import asyncio
+import aiohttp
 import json
+from itertools import cycle
 from datetime import datetime
+from pathlib import Path
+from heapq import nlargest
+from operator import itemgetter
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from dotenv import load_dotenv
 
-API_KEY = 'c6434b985f91dda9d0f7c0a8f5be1ecceac8d4a57ef27b5d11b8d9a207eab807'
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def search_tbi_daubert_cases():
+# Load environment variables
+load_dotenv()
+
+# SERP_API_KEYS may hold several comma-separated keys; queries rotate through
+# them so concurrent requests spread across each key's rate limit
+API_KEYS = [k.strip() for k in os.getenv('SERP_API_KEYS', os.getenv('SERP_API_KEY', '')).split(',') if k.strip()]
+_api_key_cycle = cycle(API_KEYS)
+
+# Search parameters shared by every query; only 'q' and 'api_key' vary per request
+_BASE_PARAMS = {
+    'engine': 'google_scholar',
+    'num': 5,
+    'as_ylo': 2020,  # Results from 2020 onwards
+    'scisbd': 1      # Sort by date
+}
+
+# Max SerpAPI requests in flight at once, to stay under the rate limit
+SERPAPI_CONCURRENCY = int(os.getenv("SERPAPI_CONCURRENCY", "4"))
+
+# Rate-limit and transient server errors worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+def _is_retryable(exc):
+    return isinstance(exc, aiohttp.ClientResponseError) and exc.status in RETRY_STATUSES
+
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    reraise=True
+)
+async def _get_json(session, params):
+    """GET search.json, raising on retryable statuses so tenacity backs off"""
+    async with session.get('https://serpapi.com/search.json', params=params) as response:
+        if response.status in RETRY_STATUSES:
+            response.raise_for_status()
+        if response.status == 200:
+            return await response.json()
+        print(f"Error: {response.status}")
+        return {}
+
+async def _fetch(session, semaphore, query):
+    """Run a single Google Scholar query through SerpAPI"""
+    print(f"\nSearching: {query[:60]}...")
+    
+    params = {**_BASE_PARAMS, 'q': query, 'api_key': next(_api_key_cycle)}
+    
+    async with semaphore:
+        try:
+            return await _get_json(session, params)
+        except aiohttp.ClientResponseError as e:
+            print(f"Error: {e.status}")
+            return {}
+
+async def search_tbi_daubert_cases():
     """Search for recent TBI Daubert cases"""
     
     # Define search queries
@@ -22,40 +87,28 @@ def search_tbi_daubert_cases():
     
     all_results = []
     
-    for query in queries:
-        print(f"\nSearching: {query[:60]}...")
-        
-        params = {
-            'engine': 'google_scholar',
-            'q': query,
-            'api_key': API_KEY,
-            'num': 5,
-            'as_ylo': 2020,  # Results from 2020 onwards
-            'scisbd': 1      # Sort by date
-        }
-        
-        response = requests.get('https://serpapi.com/search.json', params=params)
-        
-        if response.status_code == 200:
-            data = response.json()
+    # Queries are independent, so send them concurrently over one session,
+    # bounded by a semaphore so bursts don't trip SerpAPI's rate limit
+    semaphore = asyncio.Semaphore(SERPAPI_CONCURRENCY)
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=8)) as session:
+        results_json = await asyncio.gather(*[_fetch(session, semaphore, q) for q in queries])
+    
+    for query, data in zip(queries, results_json):
+        if 'organic_results' in data:
+            print(f"Found {len(data['organic_results'])} results for: {query[:60]}...")
             
-            if 'organic_results' in data:
-                print(f"Found {len(data['organic_results'])} results")
-                
-                for result in data['organic_results'][:3]:
-                    result_info = {
-                        'query': query,
-                        'title': result.get('title', ''),
-                        'snippet': result.get('snippet', ''),
-                        'link': result.get('link', ''),
-                        'publication': result.get('publication_info', {}).get('summary', ''),
-                        'cited_by': result.get('inline_links', {}).get('cited_by', {}).get('total', 0),
-                        'pdf_available': bool(result.get('resources', [])),
-                        'pdf_link': result.get('resources', [{}])[0].get('link', '') if result.get('resources') else ''
-                    }
-                    all_results.append(result_info)
-        else:
-            print(f"Error: {response.status_code}")
+            for result in data['organic_results'][:3]:
+                result_info = {
+                    'query': query,
+                    'title': result.get('title', ''),
+                    'snippet': result.get('snippet', ''),
+                    'link': result.get('link', ''),
+                    'publication': result.get('publication_info', {}).get('summary', ''),
+                    'cited_by': result.get('inline_links', {}).get('cited_by', {}).get('total', 0),
+                    'pdf_available': bool(result.get('resources', [])),
+                    'pdf_link': result.get('resources', [{}])[0].get('link', '') if result.get('resources') else ''
+                }
+                all_results.append(result_info)
     
     return all_results
 
@@ -110,8 +163,8 @@ def analyze_results(results):
     # Find most cited papers
     print("\n4. MOST INFLUENTIAL (By Citations):")
     print("-" * 50)
-    sorted_by_citations = sorted(results, key=lambda x: x['cited_by'], reverse=True)
-    for i, paper in enumerate(sorted_by_citations[:5], 1):
+    most_cited = nlargest(5, results, key=itemgetter('cited_by'))
+    for i, paper in enumerate(most_cited, 1):
         print(f"\n{i}. {paper['title']}")
         print(f"   Citations: {paper['cited_by']}")
         print(f"   Link: {paper['link']}")
@@ -120,22 +173,29 @@ def save_results(results):
     """Save results to JSON file"""
     filename = f"tbi_daubert_search_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump({
-            'search_date': datetime.now().isoformat(),
-            'total_results': len(results),
-            'results': results
-        }, f, indent=2, ensure_ascii=False)
+    payload = {
+        'search_date': datetime.now().isoformat(),
+        'total_results': len(results),
+        'results': results
+    }
+    if orjson is not None:
+        Path(filename).write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
     
     print(f"\n\nResults saved to: {filename}")
 
 if __name__ == "__main__":
+    if not API_KEYS:
+        raise SystemExit("SERP_API_KEY is not set. Add it to your .env file.")
+    
     print("Searching for TBI Daubert cases and expert testimony...")
     print("Using Google Scholar via SerpAPI")
     print("-" * 60)
     
     # Search for cases
-    results = search_tbi_daubert_cases()
+    results = asyncio.run(search_tbi_daubert_cases())
     
     # Analyze results
     analyze_results(results)
@@ -1,8 +1,9 @@
 """
 Test script for WordPerfect file processing
 """
-import os
-from document_processor import DocumentProcessor
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from processing_helpers import get_processor, load_manifest, save_manifest, split_unchanged, record_processed
 from dotenv import load_dotenv
 import logging
 
@@ -15,27 +16,42 @@ def test_wpd_processing():
     load_dotenv()
     
     # Initialize processor
-    processor = DocumentProcessor(collection_name="lexicon_wpd_test")
+    processor = get_processor("lexicon_wpd_test")
     
     # Test the extraction methods directly
     logger.info("Testing document processor with various file types...")
     
     # Check if we have any .wpd files in the tbi-corpus folder
-    wpd_files = []
-    for root, dirs, files in os.walk("tbi_corpus"):
-        for file in files:
-            if file.endswith('.wpd'):
-                wpd_files.append(os.path.join(root, file))
+    wpd_files = [str(p) for p in Path("tbi_corpus").rglob("*.wpd")]
     
     if wpd_files:
         logger.info(f"Found {len(wpd_files)} WordPerfect files")
-        for wpd_file in wpd_files:
+        
+        # Skip files that are unchanged since their last successful embedding
+        manifest = load_manifest()
+        to_process, skipped = split_unchanged(processor, wpd_files, manifest)
+        for wpd_file in skipped:
+            logger.info(f"Skipped (unchanged and already embedded): {wpd_file}")
+        
+        def process_one(wpd_file):
             try:
                 results = processor.process_documents([wpd_file])
                 logger.info(f"Successfully processed: {wpd_file}")
                 logger.info(f"Results: {results}")
+                return results
             except Exception as e:
                 logger.error(f"Failed to process {wpd_file}: {e}")
+                return None
+        
+        # Files are independent, so overlap their parsing and embedding calls
+        if to_process:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_process))) as executor:
+                futures = [executor.submit(process_one, wpd_file) for wpd_file in to_process]
+                for future in as_completed(futures):
+                    results = future.result()
+                    if results:
+                        record_processed(manifest, results)
+        save_manifest(manifest)
     else:
         logger.info("No WordPerfect files found in tbi_corpus folder")
         logger.info("The document processor has been updated to handle .wpd files")